@@ -11,7 +11,8 @@ class Coordinator:
     YOU IMPLEMENT:
     - WebSocket/HTTP server
     - Task queuing
-    - Load balancing
+    - Load balancing (keep a few tasks in flight per peer so it isn't idle
+      for a network round-trip between tasks)
     - Failover logic
     """
     
@@ -30,7 +31,8 @@ class Coordinator:
         
         TODO: Start WebSocket/HTTP server
         TODO: Accept peer and gamer connections
-        TODO: Run message loop
+        TODO: Run message loop (unpack "batch" messages and handle each
+              item in order)
         """
         raise NotImplementedError("YOU IMPLEMENT THIS")
     
@@ -67,7 +69,9 @@ class Coordinator:
             str: task_id for tracking
         
         TODO: Queue the task
-        TODO: Assign to best available peer
+        TODO: Wake the assignment loop (queue/event), don't poll on a timer
+        TODO: Assign to best available peer: argmin(outstanding tasks +
+              alpha * EWMA per-task latency), penalising recent timeouts
         TODO: Return task_id immediately
         """
         raise NotImplementedError("YOU IMPLEMENT THIS")
@@ -86,7 +90,8 @@ class Coordinator:
         
         TODO: Wait for result from peer
         TODO: Handle timeout
-        TODO: Handle peer failure and retry
+        TODO: Handle peer failure and retry (loop with exponential backoff
+              up to the attempt limit; don't recurse per retry)
         """
         raise NotImplementedError("YOU IMPLEMENT THIS")
     
@@ -95,7 +100,10 @@ class Coordinator:
         Called when a peer disconnects or times out
         
         TODO: Remove peer from pool
-        TODO: Reassign pending tasks to other peers
+        TODO: Reset each orphaned task's assignment state (assigned peer,
+              start time) so its pending timeout doesn't fire for the dead peer
+        TODO: Reassign pending tasks to other peers (front of the queue,
+              they have already waited once)
         """
         raise NotImplementedError("YOU IMPLEMENT THIS")
 
@@ -64,7 +64,10 @@ class GamerClient:
         Returns:
             bytes: Processed result
         
-        TODO: Wait for result from coordinator
+        TODO: Wait for result from coordinator (it pushes result_delivery
+              unprompted; have the receive loop resolve a per-task future
+              instead of sending a request per frame, and unpack "batch"
+              messages item by item)
         TODO: Handle timeout (return None or raise exception)
         """
         raise NotImplementedError("YOU IMPLEMENT THIS")
@@ -33,7 +33,8 @@ class PeerNode:
             bool: True if connected successfully
         
         TODO: Implement WebSocket/HTTP/TCP connection
-        TODO: Send registration message with capabilities
+        TODO: Send registration message with capabilities (detected once;
+              serialize them once too and reuse on reconnect)
         TODO: Handle connection errors
         """
         raise NotImplementedError("YOU IMPLEMENT THIS")
@@ -42,8 +43,11 @@ class PeerNode:
         """
         Main loop: receive tasks, execute them, send results
         
-        TODO: Implement message loop
-        TODO: Call execute_task() for each task received
+        TODO: Implement message loop (decode each message once and dispatch
+              on msg_type through a dict of handlers; unpack "batch" items
+              directly)
+        TODO: Call execute_task() for each task received, in a thread/process
+              pool so CPU-bound work doesn't block heartbeats and receives
         TODO: Handle disconnection and reconnection
         """
         raise NotImplementedError("YOU IMPLEMENT THIS")
@@ -79,7 +83,8 @@ class PeerNode:
         Send periodic heartbeat to coordinator
         
         TODO: Implement keep-alive mechanism
-        TODO: Include current load/status
+        TODO: Include current load/status (read it from values a background
+              sampler refreshes, not fresh psutil calls on the send path)
         """
         raise NotImplementedError("YOU IMPLEMENT THIS")
 
@@ -105,6 +105,26 @@ PEER_DISCONNECT = {
     "reason": "connection_lost"
 }
 
+# 11. BATCH (any direction, wraps messages that were ready at the same time)
+#     This JSON form is for messages without a frame payload. With Option 1
+#     below, messages carrying "data"/"result" bytes (task_submit,
+#     task_result, ...) are batched in a binary batch message instead.
+BATCH = {
+    "msg_type": "batch",
+    "items": [
+        HEARTBEAT,  # Each item is a complete message from the list above
+        {  # A failed result has no payload, so it can ride along
+            "msg_type": "task_result",
+            "task_id": "task_12346",
+            "peer_id": "peer_laptop_001",
+            "success": False,
+            "result": None,
+            "processing_time_ms": 0.0,
+            "error": "Unsupported task type"
+        }
+    ]
+}
+
 
 """
 TRANSPORT OPTIONS (you choose):
@@ -114,6 +134,17 @@ Option 1: WebSocket + JSON
 - Human-readable messages
 - Good browser support
 - Library: websockets (Python), ws (Node.js)
+- Send frame payloads ("data"/"result") as binary WebSocket messages
+  (small header + raw JPEG bytes) rather than base64 inside JSON;
+  base64 adds ~33% to every frame plus an encode/decode per hop
+- Binary batch layout (integers unsigned, network byte order):
+    [u16 item_count]
+    then per item: [u32 header_len][header: JSON message without its
+                   "data"/"result" field][u32 payload_len][payload bytes]
+  A single frame is a batch with item_count = 1; payload_len = 0 lets
+  control messages ride in the same batch
+  e.g. struct.pack("!H", n) + per item struct.pack("!I", len(h)) + h
+       + struct.pack("!I", len(p)) + p
 
 Option 2: WebSocket + Protocol Buffers
 - More efficient (smaller messages)
@@ -121,6 +152,12 @@ Option 2: WebSocket + Protocol Buffers
 - Requires .proto file definitions
 - Library: protobuf
 
+Option 2b: WebSocket + MessagePack (or CBOR)
+- Same dict-shaped messages as above, no schema files
+- Smaller and several times faster to encode/decode than json
+- Raw bytes fields travel as-is (no base64)
+- Library: msgpack (Python), cbor2
+
 Option 3: gRPC
 - Built-in request/response patterns
 - Streaming support
@@ -133,5 +170,13 @@ Option 4: Raw TCP + Custom Binary
 - Most work to implement
 - Library: socket (Python)
 
+WHATEVER YOU CHOOSE:
+- Set TCP_NODELAY on every coordinator/peer/gamer socket. Nagle +
+  delayed ACK can hold small messages for ~40ms, more than two frames
+  at 60fps
+- Don't compress JPEG payloads again. WebSocket permessage-deflate is on
+  by default in most libraries (websockets: pass compression=None); it
+  burns CPU on already-compressed frames for no size gain
+
 YOU CHOOSE WHAT WORKS BEST FOR YOUR USE CASE
 """
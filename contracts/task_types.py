@@ -11,7 +11,8 @@ class FrameUpscaler:
     CONTRACT: Upscale low-resolution frames to high-resolution
     
     YOU IMPLEMENT:
-    - Image loading/decoding
+    - Image loading/decoding (libjpeg-turbo via PyTurboJPEG is much faster
+      than PIL's JPEG codec and decodes straight to a NumPy array)
     - Upscaling algorithm (OpenCV, PIL, ML model, etc.)
     - Image encoding/compression
     """
@@ -33,6 +34,8 @@ class FrameUpscaler:
         Returns:
             bytes: Upscaled frame (JPEG/PNG compressed)
         
+        TODO: If input_res == output_res, return input_data unchanged
+              (skip the decode/encode round-trip)
         TODO: Decode input_data
         TODO: Apply upscaling algorithm
         TODO: Encode result
@@ -97,6 +100,12 @@ class AIExecutor:
             }
         
         TODO: Implement pathfinding algorithm (A*, Dijkstra, etc.)
+        TODO: Build the obstacle test once, up front. On a bounded grid
+              (max coordinate below ~1024) use a bytearray mask indexed by
+              y * W + x, so each neighbor check is one byte load; fall back
+              to a frozenset of (x, y) tuples for large or unbounded grids
+        TODO: Keep the open set in a heapq of (f_score, counter, node) and
+              skip stale entries on pop; min() over a set is O(n) per step
         """
         raise NotImplementedError("YOU IMPLEMENT THIS")
 
@@ -130,7 +139,8 @@ class PhysicsExecutor:
                 "collisions": [[obj1_id, obj2_id], ...]
             }
         
-        TODO: Implement physics integration (Euler, Verlet, etc.)
+        TODO: Implement physics integration (Euler, Verlet, etc.) on (N, 3)
+              NumPy position/velocity arrays, not per-object Python loops
         TODO: Detect and resolve collisions
         """
         raise NotImplementedError("YOU IMPLEMENT THIS")
@@ -163,7 +173,8 @@ class RayTracingExecutor:
         Returns:
             bytes: Rendered image (JPEG/PNG)
         
-        TODO: Implement ray-object intersection
+        TODO: Implement ray-object intersection (test all rays at once as
+              NumPy arrays; per-ray Python math is interpreter-bound)
         TODO: Calculate lighting and shadows
         TODO: Render to image
         """
@@ -193,12 +204,12 @@ def execute_task(task_type: str, input_data, params: dict = None):
     Returns:
         Task-specific output
     
-    TODO: Look up executor in TASK_EXECUTORS
     TODO: Call executor with input_data and params
     TODO: Handle errors
     """
-    if task_type not in TASK_EXECUTORS:
-        raise ValueError(f"Unknown task type: {task_type}")
-    
-    executor = TASK_EXECUTORS[task_type]
+    try:
+        executor = TASK_EXECUTORS[task_type]
+    except KeyError:
+        raise ValueError(f"Unknown task type: {task_type}") from None
+
     return executor(input_data, params) if params else executor(input_data)